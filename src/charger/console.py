@@ -1,42 +1,67 @@
 import argparse
+import functools
+import string
 import sys
 from os import environ
 from shlex import quote
+from typing import Optional
 
 from loguru import logger
 
 from . import __version__
 from .argtype import ModuleScoreOverrideType, PathType
-from .classifier import CharGer
 from .config import CharGerConfig
 
 logger.disable("charger")  # Disable emit logs by default
 
+# Path validators shared by the arguments (PathType holds no per-call state)
+_PATH_EXISTING = PathType(exists=True)
+_PATH_ANY = PathType()
+
+# Characters that never need shell quoting (same as shlex.quote)
+_SHELL_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "@%+=:,./-_")
+
+# Set up the preferred logging colors and format unless overridden by its environment variable
+_LOG_INFO_COLOR = environ.get("LOGURU_INFO_COLOR") or "<white>"
+_LOG_DEBUG_COLOR = environ.get("LOGURU_DEBUG_COLOR") or "<d><white>"
+_LOG_FORMAT = environ.get("LOGURU_FORMAT") or (
+    # "<green>{time:YYYY-MM-DD HH:mm:ss}</green> "
+    "<b><level>{level: <8}</level></b> "
+    "| <level>{message}</level>"
+)
+
+_sink_id: Optional[int] = None
+"""Handler ID of the stderr sink added by :func:`setup_logger`."""
+
+_DEFAULT_CONFIG = CharGerConfig()
+"""Config defaults shown by the console parser. Must not be modified."""
+
 description = """
 CharGer (Characterization of Germline variants) is a software tool for interpreting and predicting clinical pathogenicity of germline variants.
-"""  # noqa
+""".strip()  # noqa
 
 # Additional console help message text at the end
 epilog = """
 If you use CharGer, please cite our publication so we can continue to support CharGer development:
 
     Scott, A.D. et al. (2018). Bioinformatics. https://doi.org/10.1093/bioinformatics/bty649.
-"""  # noqa
+""".strip()  # noqa
 
 
+class ConsoleHelpFormatter(
+    argparse.ArgumentDefaultsHelpFormatter, argparse.RawDescriptionHelpFormatter
+):
+    """Show the argument defaults and keep the description and epilog as is."""
+
+
+@functools.lru_cache(maxsize=1)
 def create_console_parser() -> argparse.ArgumentParser:
     """Create CharGer's commandline parser.
 
+    The parser is built once and cached for the subsequent calls.
     See :class:`~charger.config.CharGerConfig` for the detailed specification of each parameter.
     """
-
-    class ConsoleHelpFormatter(
-        argparse.ArgumentDefaultsHelpFormatter, argparse.RawDescriptionHelpFormatter
-    ):
-        pass
-
-    # Obtain the config defaults
-    defaults = CharGerConfig()
+    defaults = _DEFAULT_CONFIG
 
     parser = argparse.ArgumentParser(
         description=description,
@@ -51,26 +76,26 @@ def create_console_parser() -> argparse.ArgumentParser:
         "--input",
         metavar="VCF",
         required=True,
-        type=PathType(exists=True),
+        type=_PATH_EXISTING,
         help="Path to the input VCF to be annotated",
     )
     parser.add_argument(
         "--output",
         metavar="TSV",
-        type=PathType(),
+        type=_PATH_ANY,
         help="Path to CharGer output",
     )
 
     parser.add_argument(
         "--pathogenic-variant",
         metavar="VCF",
-        type=PathType(exists=True),
+        type=_PATH_EXISTING,
         help="Path to the known pathogenic variants",
     )
     parser.add_argument(
         "--hotspot3d-cluster",
         metavar="TSV",
-        type=PathType(exists=True),
+        type=_PATH_EXISTING,
         help="Path to HotSpot3D clusters result",
     )
     parser.add_argument(
@@ -83,11 +108,16 @@ def create_console_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include the VCF details in the output",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not emit any log messages (same as setting CHARGER_QUIET=1)",
+    )
 
     acmg_grp = parser.add_argument_group("ACMG modules")
     acmg_grp.add_argument(
         "--inheritance-gene-table",
-        type=PathType(exists=True),
+        type=_PATH_EXISTING,
         metavar="TSV",
         help=(
             "Path to inheritance gene tab separated table and enable PVS1 module. "
@@ -101,13 +131,13 @@ def create_console_parser() -> argparse.ArgumentParser:
     )
     acmg_grp.add_argument(
         "--PP2-gene-list",
-        type=PathType(exists=True),
+        type=_PATH_EXISTING,
         metavar="TXT",
         help="Path to PP2 gene list (list of gene symbols)",
     )
     acmg_grp.add_argument(
         "--BP1-gene-list",
-        type=PathType(exists=True),
+        type=_PATH_EXISTING,
         metavar="TXT",
         help="Path to BP1 gene list (list of gene symbols)",
     )
@@ -132,7 +162,7 @@ def create_console_parser() -> argparse.ArgumentParser:
     anno_src_grp.add_argument(
         "--clinvar-table",
         metavar="TABIX",
-        type=PathType(exists=True),
+        type=_PATH_EXISTING,
         help=("Path to the Tabix indexed ClinVar table"),
     )
 
@@ -184,50 +214,83 @@ def create_console_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _quote_arg(arg: str) -> str:
+    """Shell-quote the argument unless it consists of safe characters only."""
+    if arg and _SHELL_SAFE_CHARS.issuperset(arg):
+        return arg
+    return quote(arg)
+
+
 def parse_console(args=None) -> CharGerConfig:
     """
     Create a :class:`~charger.config.CharGerConfig` object
     based on the command-line arguments or the given `args`.
     """
     parser = create_console_parser()
-    config = parser.parse_args(args, namespace=CharGerConfig())
-    console_parameters = " ".join(map(quote, args or sys.argv[1:]))
-    logger.info(f"Running CharGer v{__version__} with parameters: {console_parameters}")
+    options = vars(parser.parse_args(args))
+    options.pop("quiet")  # Handled by run() before the logger is set up
+    # Leave the unspecified options to the config defaults
+    config = CharGerConfig(**{k: v for k, v in options.items() if v is not None})
+    # Only quote the parameters when the message will be emitted
+    logger.opt(lazy=True).info(
+        "Running CharGer v{} with parameters: {}",
+        lambda: __version__,
+        lambda: " ".join(map(_quote_arg, args or sys.argv[1:])),
+    )
     return config
 
 
 def setup_logger() -> None:
     """Set up stderr logging format.
 
+    Calling it again replaces the stderr sink added by the previous call,
+    so the messages are never emitted twice.
     The logging format and colors can be overridden by setting up the
-    environment variables such as ``LOGURU_FORMAT``.
+    environment variables such as ``LOGURU_FORMAT``, which are read when the module is imported.
     See `Loguru documentation`_ for details.
 
     .. _Loguru documentation: https://loguru.readthedocs.io/en/stable/api/logger.html#env
     """
-    logger.remove()  # Remove the default setting
+    global _sink_id
+    if _sink_id is None:
+        logger.remove()  # Remove the default setting
+    else:
+        # Replace the sink added by the previous call unless it has been removed elsewhere
+        try:
+            logger.remove(_sink_id)
+        except ValueError:
+            pass
 
-    # Set up the preferred logging colors and format unless overridden by its environment variable
-    logger.level("INFO", color=environ.get("LOGURU_INFO_COLOR") or "<white>")
-    logger.level("DEBUG", color=environ.get("LOGURU_DEBUG_COLOR") or "<d><white>")
-    log_format = environ.get("LOGURU_FORMAT") or (
-        # "<green>{time:YYYY-MM-DD HH:mm:ss}</green> "
-        "<b><level>{level: <8}</level></b> "
-        "| <level>{message}</level>"
-    )
-    logger.add(sys.stderr, format=log_format)
+    logger.level("INFO", color=_LOG_INFO_COLOR)
+    logger.level("DEBUG", color=_LOG_DEBUG_COLOR)
+    _sink_id = logger.add(sys.stderr, format=_LOG_FORMAT)
 
     # By default all the logging messages are disabled
     logger.enable("charger")
 
 
+def _quiet_requested() -> bool:
+    """Whether ``--quiet`` is given or ``CHARGER_QUIET`` is set to a true value."""
+    env_quiet = environ.get("CHARGER_QUIET", "").lower()
+    return "--quiet" in sys.argv[1:] or env_quiet not in ("", "0", "false", "no")
+
+
 def run() -> None:
     """Entry point of the program.
 
     The ``charger`` command calls this function.
     """
-    setup_logger()
+    # Skip setting up the logger so all the messages stay disabled
+    if not _quiet_requested():
+        setup_logger()
     config = parse_console()
+    # The parser is no longer needed during the classification
+    create_console_parser.cache_clear()
+
+    # Import the classifier (and its pysam/cyvcf2 dependencies) only after the
+    # arguments are parsed so that ``--help`` and ``--version`` return quickly
+    from .classifier import CharGer
+
     charger = CharGer(config)
     charger.setup()
     charger.run_acmg_modules()
@@ -1,11 +1,14 @@
+import subprocess
+import sys
 from typing import List
 
 import attr
 import pytest
+from loguru import logger
 
-from charger import __version__
+from charger import __version__, console
 from charger.config import CharGerConfig
-from charger.console import create_console_parser, parse_console
+from charger.console import parse_console, run, setup_logger
 
 
 @pytest.fixture
@@ -14,10 +17,42 @@ def required_args(test_root):
     return [f"--input={example_input_vcf}"]
 
 
+class DummyCharGer:
+    """A CharGer replacement that skips the classification."""
+
+    def __init__(self, config: CharGerConfig):
+        self.config = config
+
+    def setup(self):
+        pass
+
+    def run_acmg_modules(self):
+        pass
+
+    def run_charger_modules(self):
+        pass
+
+
+@pytest.fixture
+def console_logger(monkeypatch):
+    """Let setup_logger() replace a placeholder sink and remove its sink afterwards.
+
+    Starting from the placeholder keeps setup_logger() from removing all the
+    existing handlers, which would affect the other tests.
+    """
+    monkeypatch.setattr(console, "_sink_id", logger.add(lambda message: None))
+    yield
+    if console._sink_id is not None:
+        try:
+            logger.remove(console._sink_id)
+        except ValueError:
+            pass
+    logger.disable("charger")
+
+
 def test_default_config(default_config: CharGerConfig, required_args: List[str]):
     # Make sure we can launch CharGer with default settings
-    parser = create_console_parser()
-    config = parser.parse_args(required_args, namespace=CharGerConfig())
+    config = parse_console(required_args)
 
     # Remove the required arguments
     default_config_d = attr.asdict(default_config)
@@ -29,11 +64,32 @@ def test_default_config(default_config: CharGerConfig, required_args: List[str])
     assert config_d == default_config_d
 
 
+@pytest.mark.parametrize("option", ["--help", "--version"])
+def test_help_skips_classifier_import(option):
+    # Run in a new process because the classifier is already imported by other tests
+    code = (
+        "import sys\n"
+        "from charger.console import run\n"
+        f"sys.argv = ['charger', {option!r}]\n"
+        "try:\n"
+        "    run()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'charger.classifier' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+
 def test_version_string_in_log(required_args, caplog):
     parse_console(required_args)
     assert f"Running CharGer v{__version__} " in caplog.text
 
 
+def test_console_quiet(required_args: List[str]):
+    config = parse_console(required_args + ["--quiet"])
+    assert attr.asdict(config) == attr.asdict(parse_console(required_args))
+
+
 def test_console_score_override(required_args: List[str], caplog):
     config = parse_console(
         required_args
@@ -53,3 +109,56 @@ def test_console_score_override_invalid_module(required_args: List[str]):
     with pytest.raises(SystemExit) as excinfo:
         parse_console(required_args + ["--override-acmg-score=PPAP=999"])
         assert "Module does not exist: PPAP" in excinfo.value.message
+
+
+def test_setup_logger_twice(console_logger, capsys):
+    setup_logger()
+    setup_logger()
+    logger.info("Log once")
+    assert capsys.readouterr().err.count("Log once") == 1
+
+
+def test_setup_logger_after_sink_removed(console_logger, capsys):
+    setup_logger()
+    logger.remove(console._sink_id)  # Remove the sink behind setup_logger()'s back
+    setup_logger()
+    logger.info("Log once")
+    assert capsys.readouterr().err.count("Log once") == 1
+
+
+@pytest.mark.parametrize(
+    "quiet_args, quiet_env",
+    [(["--quiet"], None), ([], "1"), ([], "true")],
+)
+def test_run_quiet(monkeypatch, console_logger, required_args, quiet_args, quiet_env):
+    monkeypatch.setattr("charger.classifier.CharGer", DummyCharGer)
+    monkeypatch.setattr(sys, "argv", ["charger"] + required_args + quiet_args)
+    if quiet_env is None:
+        monkeypatch.delenv("CHARGER_QUIET", raising=False)
+    else:
+        monkeypatch.setenv("CHARGER_QUIET", quiet_env)
+
+    placeholder_id = console._sink_id
+    messages: List[str] = []
+    handler_id = logger.add(messages.append, format="{message}")
+    try:
+        run()
+    finally:
+        logger.remove(handler_id)
+    # No stderr sink is added and the charger messages stay disabled
+    assert console._sink_id == placeholder_id
+    assert messages == []
+
+
+@pytest.mark.parametrize("quiet_env", [None, "0", "false", "no"])
+def test_run_not_quiet(monkeypatch, console_logger, required_args, quiet_env):
+    monkeypatch.setattr("charger.classifier.CharGer", DummyCharGer)
+    monkeypatch.setattr(sys, "argv", ["charger"] + required_args)
+    if quiet_env is None:
+        monkeypatch.delenv("CHARGER_QUIET", raising=False)
+    else:
+        monkeypatch.setenv("CHARGER_QUIET", quiet_env)
+
+    placeholder_id = console._sink_id
+    run()
+    assert console._sink_id != placeholder_id
@@ -1,7 +1,19 @@
-from textwrap import dedent
-
 from loguru import logger
 
+_LONG_STRING_A = """
+Basic research is performed without thought of practical ends.
+It results in general knowledge and an understanding of nature and its laws.
+
+A worker in basic scientific research is motivated by a driving curiosity about the unknown.
+"""
+
+_LONG_STRING_B = """
+Basic research is performed without ends of practical thoughts.
+It results in general knowledge and an understanding of nature and its laws.
+
+A worker in basic scientific research is motivated by a driving unknown about curiosity.
+"""
+
 
 def test_charger_version():
     # make sure the version is the same on PyPI and in __init__.py
@@ -23,20 +35,4 @@ def test_log_capture(caplog):
 
 # @pytest.mark.xfail(reason="Demo of long string comparison")
 def test_long_string():
-    long_string_a = dedent(
-        """
-        Basic research is performed without thought of practical ends.
-        It results in general knowledge and an understanding of nature and its laws.
-
-        A worker in basic scientific research is motivated by a driving curiosity about the unknown.
-        """
-    )
-    long_string_b = dedent(
-        """
-        Basic research is performed without ends of practical thoughts.
-        It results in general knowledge and an understanding of nature and its laws.
-
-        A worker in basic scientific research is motivated by a driving unknown about curiosity.
-        """
-    )
-    assert long_string_a != long_string_b
+    assert _LONG_STRING_A != _LONG_STRING_B